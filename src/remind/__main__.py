@@ -3,14 +3,17 @@ The main entrypoint
 """
 
 import argparse
+from typing import TYPE_CHECKING
 
-from . import reminder_manager
-from . import query_manager
+if TYPE_CHECKING:
+    from .reminder_manager import ReminderManager
 
-def handle_args(manager_r: reminder_manager.ReminderManager,
-                manager_q: query_manager.QueryManager) -> None:
+def handle_args(manager_r: "ReminderManager | None" = None) -> None:
     """
     Parse arguments passed to RemindMail
+
+    The ReminderManager is imported and created after parsing unless one is
+    passed in, so `--help` and invalid arguments exit without loading Cabinet.
     """
 
     parser = argparse.ArgumentParser(description="A tool to schedule and organize reminders")
@@ -100,6 +103,11 @@ def handle_args(manager_r: reminder_manager.ReminderManager,
     try:
         args = parser.parse_args()
 
+        if manager_r is None:
+            # imported here so `--help` skips Cabinet and its dependencies
+            from . import reminder_manager # pylint: disable=import-outside-toplevel
+            manager_r = reminder_manager.ReminderManager()
+
         if args.generate:
             manager_r.generate(is_dry_run=args.dry_run)
         elif args.later:
@@ -115,6 +123,11 @@ def handle_args(manager_r: reminder_manager.ReminderManager,
         elif args.list_all:
             manager_r.parse_reminders_file(is_print=True)
         else:
+            # imported here so other commands skip prompt_toolkit and dateutil
+            from . import query_manager # pylint: disable=import-outside-toplevel
+
+            manager_q = query_manager.QueryManager(manager_r)
+
             # handle title
             title = args.title
             if isinstance(title, list):
@@ -137,11 +150,8 @@ def main():
     The main function
     """
 
-    manager_remind = reminder_manager.ReminderManager()
-    manager_query = query_manager.QueryManager(manager_remind)
-
     try:
-        handle_args(manager_remind, manager_query)
+        handle_args()
     except KeyboardInterrupt:
         print("\n")
 
@@ -3,7 +3,6 @@ handles reminder requests
 """
 
 import re
-import sys
 from typing import Tuple, Optional
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta, MO, TU, WE, TH, FR, SA, SU
@@ -11,7 +10,40 @@ from remind.reminder import Reminder, ReminderKeyType
 from remind.reminder_confirmation import ReminderConfirmation
 from remind.reminder_manager import ReminderManager
 from prompt_toolkit import print_formatted_text, HTML
-from cabinet import Cabinet, Mail
+from cabinet import Cabinet
+
+# weekday names mapped to the next occurrence of that weekday
+WEEKDAYS = {
+    "monday": MO(+1), "mon": MO(+1),
+    "tuesday": TU(+1), "tue": TU(+1),
+    "wednesday": WE(+1), "wed": WE(+1),
+    "thursday": TH(+1), "thu": TH(+1),
+    "friday": FR(+1), "fri": FR(+1),
+    "saturday": SA(+1), "sat": SA(+1),
+    "sunday": SU(+1), "sun": SU(+1),
+}
+
+# natural language date patterns, compiled once per process
+REGEX_PATTERNS = {
+    'relative': re.compile(r'(?:in )?(\d+) (day|week|month|year)s?(?: from now)?',
+                           re.IGNORECASE),
+    'day_of_month': re.compile(r'\b(?:the )?(\d{1,2})(st|nd|rd|th)?\b', re.IGNORECASE),
+    'every_weeks': re.compile(r'every (\d+) weeks?', re.IGNORECASE),
+    'specific_date': re.compile(
+        r'(?i)\b(january|february|march|april|may|june|july|august|'
+        r'september|october|november|december) (\d{1,2})'
+        r'(?:,? (\d{4}))?\b',
+        re.IGNORECASE
+    ),
+    'mm_dd_yyyy': re.compile(r'(\d{1,2})/(\d{1,2})(?:/(\d{4}))?'),
+    'yyyy_mm_dd': re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'),
+    'every_n_days': re.compile(r'every (\d+ )?day?s?', re.IGNORECASE),
+    'every_n_weeks': re.compile(r'every (\d+ )?week?s?', re.IGNORECASE),
+    'every_n_months': re.compile(r'every (\d+ )?month?s?', re.IGNORECASE),
+    'every_n_dows': re.compile(r'every (\d+) (monday|mon|tuesday|tue|wednesday'
+                               r'|wed|thursday|thu|friday|fri|saturday|sat|sunday|sun)s?',
+                               re.IGNORECASE),
+}
 
 class QueryManager:
     """
@@ -21,7 +53,6 @@ class QueryManager:
     def __init__(self, manager: ReminderManager) -> None:
         self.manager: ReminderManager = manager
         self.cabinet: Cabinet = self.manager.cabinet
-        self.mail: Mail = self.manager.mail
         return
 
     def interpret_reminder_date(self, input_str: str) -> Reminder:
@@ -70,41 +101,8 @@ class QueryManager:
                 value = proposed_date.strftime('%Y-%m-%d')
             return key, value
 
-        weekdays = {
-            "monday": MO(+1), "mon": MO(+1),
-            "tuesday": TU(+1), "tue": TU(+1),
-            "wednesday": WE(+1), "wed": WE(+1),
-            "thursday": TH(+1), "thu": TH(+1),
-            "friday": FR(+1), "fri": FR(+1),
-            "saturday": SA(+1), "sat": SA(+1),
-            "sunday": SU(+1), "sun": SU(+1),
-        }
-
-        # Precompile regular expressions
-        regex_patterns = {
-            'relative': re.compile(r'(?:in )?(\d+) (day|week|month|year)s?(?: from now)?',
-                                   re.IGNORECASE),
-            'day_of_month': re.compile(r'\b(?:the )?(\d{1,2})(st|nd|rd|th)?\b', re.IGNORECASE),
-            'every_weeks': re.compile(r'every (\d+) weeks?', re.IGNORECASE),
-            'specific_date': re.compile(
-                                r'(?i)\b(january|february|march|april|may|june|july|august|'
-                                r'september|october|november|december) (\d{1,2})'
-                                r'(?:,? (\d{4}))?\b',
-                                re.IGNORECASE
-                            ),
-            'mm_dd': re.compile(r'(\d{1,2})/(\d{1,2})'),
-            'mm_dd_yyyy': re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})'),
-            'yyyy_mm_dd': re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})'),
-            'every_n_days': re.compile(r'every (\d+ )?day?s?', re.IGNORECASE),
-            'every_n_weeks': re.compile(r'every (\d+ )?week?s?', re.IGNORECASE),
-            'every_n_months': re.compile(r'every (\d+ )?month?s?', re.IGNORECASE),
-            'every_n_dows': re.compile(r'every (\d+) (monday|mon|tuesday|tue|wednesday'
-                                       r'|wed|thursday|thu|friday|fri|saturday|sat|sunday|sun)s?',
-                                       re.IGNORECASE),
-        }
-
-        # common replacements
-        input_str = input_str.replace("every week", "every sunday")
+        # common replacements; all matching below is case-insensitive
+        input_lower = input_str.casefold().replace("every week", "every sunday")
 
         now = datetime.now()
         start_date = now.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -119,9 +117,9 @@ class QueryManager:
         modifiers = 'd'
 
         # parse input_str
-        if 'every' not in input_str:
+        if 'every' not in input_lower:
             # relative
-            if match := regex_patterns['relative'].search(input_str):
+            if match := REGEX_PATTERNS['relative'].search(input_lower):
                 number = int(match.group(1))
                 unit = match.group(2)
                 delta = {'day': relativedelta(days=number),
@@ -136,53 +134,51 @@ class QueryManager:
                 value = future_date.strftime('%Y-%m-%d')
 
             # mm/dd, mm/dd/yyyy
-            elif match := regex_patterns['mm_dd'].match(input_str) or \
-                    regex_patterns['mm_dd_yyyy'].match(input_str):
+            elif match := REGEX_PATTERNS['mm_dd_yyyy'].match(input_lower):
                 month, day = int(match.group(1)), int(match.group(2))
-                year = int(match.group(3)) if match.lastindex == 3 else start_date.year
+                year = int(match.group(3)) if match.group(3) else start_date.year
                 proposed_date = datetime(year, month, day)
                 key, value = set_date_key_value(proposed_date, value, key)
 
             # yyyy-mm-dd
-            elif match := regex_patterns['yyyy_mm_dd'].match(input_str):
+            elif match := REGEX_PATTERNS['yyyy_mm_dd'].match(input_lower):
                 year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
                 proposed_date = datetime(year, month, day)
                 key, value = set_date_key_value(proposed_date, value, key)
 
             # day of month
-            elif match := regex_patterns['day_of_month'].match(input_str):
+            elif match := REGEX_PATTERNS['day_of_month'].match(input_lower):
                 key = ReminderKeyType.DAY_OF_MONTH
                 value = match.group(1)
 
             # specific weekday
-            elif any(day in input_str.lower() for day in weekdays):
-                day_str = input_str.lower()
-                for day, rel_day in weekdays.items():
-                    if day in day_str:
+            elif any(day in input_lower for day in WEEKDAYS):
+                for day, rel_day in WEEKDAYS.items():
+                    if day in input_lower:
                         next_weekday = start_date + relativedelta(days=1, weekday=rel_day)
                         key = ReminderKeyType.DATE
                         value = next_weekday.strftime('%Y-%m-%d')
                         break
 
             # specific date
-            elif match := regex_patterns['specific_date'].search(input_str):
+            elif match := REGEX_PATTERNS['specific_date'].search(input_lower):
                 year = match.group(3) or start_date.year
                 date_str = f"{year}-{match.group(1)[:3].title()}-{match.group(2).zfill(2)}"
                 date_formatted = datetime.strptime(date_str, '%Y-%b-%d')
                 key, value = set_date_key_value(date_formatted, value, key)
 
             # tomorrow
-            elif input_str == 'tomorrow':
+            elif input_lower == 'tomorrow':
                 key = ReminderKeyType.DATE
                 start_date += relativedelta(days=1)
                 value = start_date.strftime('%Y-%m-%d')
 
             # now
-            elif input_str == 'now':
+            elif input_lower == 'now':
                 key = ReminderKeyType.NOW
 
             # later
-            elif input_str == 'later':
+            elif input_lower == 'later':
                 key = ReminderKeyType.LATER
 
         else:
@@ -190,44 +186,41 @@ class QueryManager:
             modifiers = ''
 
             # every n days
-            if match := regex_patterns['every_n_days'].match(input_str):
+            if match := REGEX_PATTERNS['every_n_days'].match(input_lower):
                 key = ReminderKeyType.DAY
                 frequency = int(match.group(1) or 1)
 
             # every n weeks
-            elif match := regex_patterns['every_n_weeks'].match(input_str):
+            elif match := REGEX_PATTERNS['every_n_weeks'].match(input_lower):
                 key = ReminderKeyType.WEEK
                 frequency = int(match.group(1) or 1)
 
             # every n months
-            elif match := regex_patterns['every_n_months'].match(input_str):
+            elif match := REGEX_PATTERNS['every_n_months'].match(input_lower):
                 key = ReminderKeyType.MONTH
                 frequency = int(match.group(1) or 1)
 
             # every n {dow}s (e.g., 'every 3 mondays')
-            elif match := regex_patterns['every_n_dows'].match(input_str):
+            elif match := REGEX_PATTERNS['every_n_dows'].match(input_lower):
                 dow = match.group(2).lower()
-                if dow in weekdays:
+                if dow in WEEKDAYS:
                     key = ReminderKeyType.DAY_OF_WEEK
                     value = dow
                     frequency = int(match.group(1))
 
             # every {dow} (e.g. 'every friday')
-            elif any(day in input_str.lower() for day in weekdays):
-                day_str = input_str.lower()
-                for day, rel_day in weekdays.items():
-                    if day in day_str:
-                        next_weekday = start_date + relativedelta(weekday=rel_day(0))
+            elif any(day in input_lower for day in WEEKDAYS):
+                for day in WEEKDAYS:
+                    if day in input_lower:
                         key = ReminderKeyType.DAY_OF_WEEK
                         value = day
                         frequency = 1
                         break
 
             # every n weeks
-            elif match := regex_patterns['every_weeks'].match(input_str):
+            elif match := REGEX_PATTERNS['every_weeks'].match(input_lower):
                 key = ReminderKeyType.WEEK
                 frequency = int(match.group(1))
-                modifiers = ''
 
         if key is None:
             self.cabinet.log(f"Could not parse date: {input_str}",
@@ -243,7 +236,7 @@ class QueryManager:
                         index=0,
                         offset=0,
                         cabinet=self.cabinet,
-                        mail=self.mail,
+                        mail=self.manager.mail_if_created,
                         path_remind_file=self.manager.remind_path_file)
 
     def wizard_manual_reminder(self, title: str | None = None,
@@ -291,7 +284,9 @@ class QueryManager:
             try:
                 ReminderConfirmation(reminder).run()
             except KeyboardInterrupt:
-                sys.exit(0)
+                # treat as cancelled, matching the 'Cancel' button
+                reminder.modifiers = "x"
+                return reminder
         else:
             print_formatted_text(HTML('<ansigreen><b>Done.</b></ansigreen>'))
 
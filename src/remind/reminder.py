@@ -1,11 +1,16 @@
 """
 The main class
 """
-from datetime import datetime, date, timedelta
+import os
+from datetime import datetime, date
 from typing import Optional
 from enum import Enum
 from cabinet import Cabinet, Mail
 
+# proleptic ordinal of 1970-01-01, the anchor for frequency calculations
+EPOCH_ORDINAL: int = date(1970, 1, 1).toordinal()
+EPOCH_WEEKDAY: int = date(1970, 1, 1).weekday()
+
 class ReminderKeyType(Enum):
     """
     Enum for `Reminder.key` with database value and label.
@@ -37,10 +42,10 @@ class ReminderKeyType(Enum):
         Returns:
             ReminderKeyType: The enum member matching the given database value.
         """
-        for member in cls:
-            if member.db_value == db_value:
-                return member
-        raise ValueError(f"{db_value} is not a valid db_value of ReminderKeyType")
+        member = _DB_VALUE_TO_KEY.get(db_value)
+        if member is None:
+            raise ValueError(f"{db_value} is not a valid db_value of ReminderKeyType")
+        return member
 
     def __init__(self, db_value, label):
         """
@@ -53,6 +58,17 @@ class ReminderKeyType(Enum):
         self.db_value: str = db_value
         self.label: str = label
 
+# maps each db_value to its ReminderKeyType for constant-time lookups
+_DB_VALUE_TO_KEY = {member.db_value: member for member in ReminderKeyType}
+
+# reminder types that store a value alongside the key
+VALUE_KEYS = frozenset((ReminderKeyType.DATE,
+                        ReminderKeyType.DAY_OF_WEEK,
+                        ReminderKeyType.DAY_OF_MONTH))
+
+# maps the first three letters of a weekday to `date.weekday()`
+DOW_TO_INT = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+
 class Reminder:
     """
     Represents a reminder with various attributes defining its schedule and actions.
@@ -72,7 +88,8 @@ class Reminder:
         notes (str): Additional notes associated with the reminder.
         index (int): The index of the actual line in which this reminder starts in remind.md
         cabinet (Cabinet): instance of Cabinet, a file management tool
-        mail (Mail): The instance in which to send reminders as emails
+        mail (Mail): The instance in which to send reminders as emails;
+            created on first use if none is given
         path_remind_file: The path from ReminderManager in which to access remind.md
     """
     def __init__(self,
@@ -85,7 +102,7 @@ class Reminder:
                  notes: Optional[str],
                  index: int,
                  cabinet: Cabinet,
-                 mail: Mail,
+                 mail: Optional[Mail],
                  path_remind_file: str | None):
         self.key = key
         self.value: Optional[str] = value
@@ -97,9 +114,22 @@ class Reminder:
         self.index: int = index
         self.should_send_today: Optional[bool] = False
         self.cabinet: Cabinet = cabinet
-        self.mail: Mail = mail
+        self._mail: Optional[Mail] = mail
         self.path_remind_file: str | None = path_remind_file
 
+    @property
+    def mail(self) -> Mail:
+        """
+        The Mail instance used by `send_email()`, created on first use.
+        """
+        if self._mail is None:
+            self._mail = Mail()
+        return self._mail
+
+    @mail.setter
+    def mail(self, mail: Mail) -> None:
+        self._mail = mail
+
     def __repr__(self) -> str:
         return (
             f"Reminder(key={self.key.db_value}, "
@@ -147,19 +177,21 @@ class Reminder:
                 # if the reminder is scheduled in the past as YYYY-MM-DD
                 # and it didn't send, then for the purposes of `generate()`,
                 # set the date to today so it can send, then add a note about it.
+                # the note is added once, as `generate()` counts it when
+                # deciding which lines to delete.
                 if reminder_date < today:
+                    missed_note = f"This was scheduled to send on {reminder_date}.\n"
                     if not self.notes:
                         self.notes = ""
-                    self.notes += f"This was scheduled to send on {reminder_date}.\n"
+                    if not self.notes.startswith(missed_note):
+                        self.notes = missed_note + self.notes
                     reminder_date = datetime.now().date()
             return reminder_date == today
 
         # Handle day of the week reminders
         elif self.key == ReminderKeyType.DAY_OF_WEEK and self.value:
-            dow_mapping = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
-
-            # default to non-existant day
-            target_dow = dow_mapping.get(self.value.lower(), 7)
+            # default to non-existant day; [monday] and [mon] both map to 0
+            target_dow = DOW_TO_INT.get(self.value.lower()[:3], 7)
 
             # handle day not found
             if target_dow == 7:
@@ -171,16 +203,14 @@ class Reminder:
             if today.weekday() != target_dow:
                 return False
 
-            # calculate the number of days since the epoch start
-            epoch_start = date(1970, 1, 1)
-            days_since_epoch = (today - epoch_start).days
+            if self.frequency <= 0:
+                return True
 
             # find the first occurrence of the target day of the week from epoch
-            days_to_target_dow = (target_dow - epoch_start.weekday()) % 7
-            first_target_dow = epoch_start + timedelta(days=days_to_target_dow)
+            first_target_ordinal = EPOCH_ORDINAL + (target_dow - EPOCH_WEEKDAY) % 7
 
             # calculate weeks since the first occurrence of the target day
-            weeks_since_first_target = (today - first_target_dow).days // 7
+            weeks_since_first_target = (today.toordinal() - first_target_ordinal) // 7
 
             # adjust for offset and check against frequency
             adjusted_weeks = weeks_since_first_target - self.offset
@@ -189,8 +219,7 @@ class Reminder:
         # Handle every n days
         elif self.key == ReminderKeyType.DAY:
             if self.frequency > 0:
-                epoch_start = date(1970, 1, 1)
-                days_since_epoch = (today - epoch_start).days
+                days_since_epoch = today.toordinal() - EPOCH_ORDINAL
                 adjusted_days = days_since_epoch - self.offset
                 return adjusted_days % self.frequency == 0
             return True
@@ -198,9 +227,9 @@ class Reminder:
         # Handle weekly reminders
         elif self.key == ReminderKeyType.WEEK:
             if self.frequency > 0:
-                start_date = today - timedelta(weeks=self.offset)
-                weeks_diff = (today - start_date).days // 7
-                return weeks_diff % self.frequency == 0 and today.weekday() == 6
+                weeks_since_epoch = (today.toordinal() - EPOCH_ORDINAL) // 7
+                adjusted_weeks = weeks_since_epoch - self.offset
+                return adjusted_weeks % self.frequency == 0 and today.weekday() == 6
             return True
 
         # Handle monthly reminders
@@ -259,9 +288,7 @@ class Reminder:
             if self.key == ReminderKeyType.DATE:
                 base_format = "["
 
-            if self.key not in [ReminderKeyType.DATE,
-                                ReminderKeyType.DAY_OF_WEEK,
-                                ReminderKeyType.DAY_OF_MONTH]:
+            if self.key not in VALUE_KEYS:
                 self.value = ""
 
             if self.value:
@@ -287,11 +314,18 @@ class Reminder:
 
         reminder_format = format_reminder()
 
-        path_remind_file = self.path_remind_file or \
-            self.cabinet.get('path', 'remindmail', 'file') or ""
-        path_remind_folder = path_remind_file.replace("/remind.md", "")
+        # cache the lookup so subsequent writes skip Cabinet
+        if not self.path_remind_file:
+            self.path_remind_file = self.cabinet.get('remindmail', 'path', 'file')
+        path_remind = self.path_remind_file or ""
+
+        # the configured path may be the folder holding remind.md
+        if os.path.isdir(path_remind):
+            path_remind_folder, file_name = path_remind, "remind.md"
+        else:
+            path_remind_folder, file_name = os.path.split(path_remind)
 
-        self.cabinet.write_file('remind.md',
+        self.cabinet.write_file(file_name or 'remind.md',
                                 path_remind_folder,
                                 reminder_format,
                                 append=True,
@@ -12,7 +12,15 @@ from prompt_toolkit.layout.dimension import Dimension
 from prompt_toolkit.widgets import TextArea, Box, Label
 from prompt_toolkit.layout.containers import WindowAlign, ConditionalContainer
 from prompt_toolkit.filters import has_focus, Condition
-from remind.reminder import Reminder, ReminderKeyType
+from remind.reminder import Reminder, ReminderKeyType, VALUE_KEYS
+
+# type labels that enable each field; checked on every redraw
+VALUE_LABELS = frozenset(key.label for key in VALUE_KEYS)
+NO_SCHEDULE_LABELS = frozenset((ReminderKeyType.DATE.label,
+                                ReminderKeyType.LATER.label,
+                                ReminderKeyType.NOW.label))
+NO_MODIFIER_LABELS = frozenset((ReminderKeyType.LATER.label,
+                                ReminderKeyType.NOW.label))
 
 class ReminderConfirmation:
     """
@@ -136,6 +144,11 @@ class ReminderConfirmation:
 
         self.reminder_types: List[ReminderKeyType] = list(ReminderKeyType)
 
+        # position of each type in reminder_types, for cycling
+        self.reminder_type_index: dict[ReminderKeyType, int] = {
+            t: i for i, t in enumerate(self.reminder_types)
+        }
+
         # text areas
         self.title_text_area = generate_textarea(self.reminder.title, 'Title')
         self.type_text_area = generate_textarea(self.reminder.key.label, 'Type', True)
@@ -360,40 +373,23 @@ class ReminderConfirmation:
 
             return handler
 
+        def bind_handlers(container, property_attr, text_area):
+            # one handler per direction, shared by the arrow and vi keys
+            increment_handler = create_handler(property_attr, text_area, True)
+            decrement_handler = create_handler(property_attr, text_area, False)
+
+            for key in ('right', 'l'):
+                self.bindings.add(key, filter=has_focus(container))(increment_handler)
+            for key in ('left', 'h'):
+                self.bindings.add(key, filter=has_focus(container))(decrement_handler)
+
         # Bind handlers for frequency, offset, and value
+        bind_handlers(self.frequency_input, 'frequency', self.frequency_text_area)
+        bind_handlers(self.offset_input, 'offset', self.offset_input_text_area)
 
-        # Frequency handlers
-        self.bindings.add('right', filter=has_focus(self.frequency_input))(
-            create_handler('frequency', self.frequency_text_area, True))
-        self.bindings.add('l', filter=has_focus(self.frequency_input))(
-            create_handler('frequency', self.frequency_text_area, True))
-        self.bindings.add('left', filter=has_focus(self.frequency_input))(
-            create_handler('frequency', self.frequency_text_area, False))
-        self.bindings.add('h', filter=has_focus(self.frequency_input))(
-            create_handler('frequency', self.frequency_text_area, False))
-
-        # Offset handlers
-        self.bindings.add('right', filter=has_focus(self.offset_input))(
-            create_handler('offset', self.offset_input_text_area, True))
-        self.bindings.add('l', filter=has_focus(self.offset_input))(
-            create_handler('offset', self.offset_input_text_area, True))
-        self.bindings.add('left', filter=has_focus(self.offset_input))(
-            create_handler('offset', self.offset_input_text_area, False))
-        self.bindings.add('h', filter=has_focus(self.offset_input))(
-            create_handler('offset', self.offset_input_text_area, False))
-
-        # Value handlers
         if self.reminder.key == ReminderKeyType.DATE or \
             self.reminder.key == ReminderKeyType.DAY_OF_MONTH:
-
-            self.bindings.add('right', filter=has_focus(self.value_input))(
-                create_handler('value', self.value_text_area, True))
-            self.bindings.add('l', filter=has_focus(self.value_input))(
-                create_handler('value', self.value_text_area, True))
-            self.bindings.add('left', filter=has_focus(self.value_input))(
-                create_handler('value', self.value_text_area, False))
-            self.bindings.add('h', filter=has_focus(self.value_input))(
-                create_handler('value', self.value_text_area, False))
+            bind_handlers(self.value_input, 'value', self.value_text_area)
 
     def setup_save_and_cancel_handlers(self):
         """
@@ -434,14 +430,7 @@ class ReminderConfirmation:
         """
 
         # Find current index based on current reminder type
-        # Create a generator to find the index of the current reminder type
-        index_generator = (
-            i for i, t in enumerate(self.reminder_types)
-            if t.db_value == self.reminder.key.db_value
-        )
-
-        # Use next to get the first index from the generator or return None if no match is found
-        current_index = next(index_generator, None)
+        current_index = self.reminder_type_index.get(self.reminder.key)
 
         if current_index is None:
             # handle the case where the current type is not found
@@ -469,11 +458,8 @@ class ReminderConfirmation:
         self.update_toolbar_text()
 
         # get cache
-        try:
-            if self.key_value_cache[self.reminder.key.label]:
-                self.value_text_area.text = self.key_value_cache[self.reminder.key.label]
-                self.reminder.value = self.key_value_cache[self.reminder.key.label]
-        except KeyError:
+        cached_value = self.key_value_cache.get(self.reminder.key.label)
+        if cached_value is None:
             # cache not set for this type
             if self.reminder.key == ReminderKeyType.DAY_OF_WEEK:
                 self.value_text_area.text = "Sunday"
@@ -481,6 +467,9 @@ class ReminderConfirmation:
                 self.value_text_area.text = "1"
 
             self.reminder.value = self.value_text_area.text
+        elif cached_value:
+            self.value_text_area.text = cached_value
+            self.reminder.value = cached_value
 
     def handle_navigation(self, event, key: str) -> None:
         """
@@ -496,7 +485,7 @@ class ReminderConfirmation:
         """
 
         # handle VI mode
-        if (key == 'j' or key == 'k') and self.application.layout.has_focus(self.save_button):
+        if key in ('j', 'k') and self.application.layout.has_focus(self.save_button):
             self.is_vi_mode = True
 
         if (key == 'j' and self.is_vi_mode) or key == 'down':
@@ -592,9 +581,7 @@ class ReminderConfirmation:
             bool: True if the reminder type requires a value, False otherwise.
         """
 
-        return self.type_text_area.text in [ReminderKeyType.DAY_OF_WEEK.label,
-                                        ReminderKeyType.DAY_OF_MONTH.label,
-                                        ReminderKeyType.DATE.label]
+        return self.type_text_area.text in VALUE_LABELS
 
     def is_frequency_enabled(self) -> bool:
         """
@@ -604,9 +591,7 @@ class ReminderConfirmation:
             bool: True if the frequency setting is applicable, False otherwise.
         """
 
-        return self.type_text_area.text not in [ReminderKeyType.DATE.label,
-                                            ReminderKeyType.LATER.label,
-                                            ReminderKeyType.NOW.label]
+        return self.type_text_area.text not in NO_SCHEDULE_LABELS
 
     def is_offset_enabled(self) -> bool:
         """
@@ -616,9 +601,7 @@ class ReminderConfirmation:
             bool: True if offsets can be set for the type, False if not.
         """
 
-        return self.type_text_area.text not in [ReminderKeyType.DATE.label,
-                                            ReminderKeyType.LATER.label,
-                                            ReminderKeyType.NOW.label]
+        return self.type_text_area.text not in NO_SCHEDULE_LABELS
 
     def is_modifiers_enabled(self) -> bool:
         """
@@ -628,8 +611,7 @@ class ReminderConfirmation:
             bool: True if modifiers are applicable, False otherwise.
         """
 
-        return self.type_text_area.text not in [ReminderKeyType.LATER.label,
-                                            ReminderKeyType.NOW.label]
+        return self.type_text_area.text not in NO_MODIFIER_LABELS
 
     def run(self):
         """
@@ -7,13 +7,41 @@ import os
 import subprocess
 import glob
 import readline
+import shutil
+import tempfile
 from datetime import date, timedelta, datetime
-from typing import List, Optional
-from rich.console import Console
+from typing import List, Optional, TYPE_CHECKING
 from remind.reminder import ReminderKeyType
 from cabinet import Cabinet, Mail
 from . import reminder, error_handler
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# reminder line patterns, compiled once per process rather than per line
+PATTERN_ANY_REMINDER = re.compile(r"\[(.*?)\](c?d?)\s*(.*)")
+PATTERN_DATE_KEY = re.compile(r"(?:\d{4}-)?\d{2}-\d{2}")
+PATTERN_COMMENT = re.compile(r"\s*#.*")
+
+# keys accepted as a bare weekday, e.g. [mon] or [monday]
+DOW_KEYS = frozenset((
+    "sun", "sunday",
+    "mon", "monday",
+    "tue", "tuesday",
+    "wed", "wednesday",
+    "thu", "thursday",
+    "fri", "friday",
+    "sat", "saturday",
+))
+
+# reminder types whose details are [key,frequency,offset]
+FREQUENCY_KEYS = frozenset((ReminderKeyType.DAY,
+                            ReminderKeyType.WEEK,
+                            ReminderKeyType.MONTH))
+
+# matches for the path being completed; reused while readline cycles through `state`
+_completion_matches: List[str] = []
+
 def complete_file_input(text, state):
     """
     Provides tab completion for file paths in a command-line interface.
@@ -37,10 +65,61 @@ def complete_file_input(text, state):
     Raises:
     - IndexError: If the 'state' index is out of the range of available completions.
     """
-    text = os.path.expanduser(os.path.expandvars(text))
+    # readline starts each completion at state 0; glob once, then index into the results
+    if state == 0:
+        text = os.path.expanduser(os.path.expandvars(text))
+        _completion_matches[:] = glob.glob(text + '*')
+
+    return _completion_matches[state]
+
+def write_lines_atomically(path: str, lines: List[str]) -> None:
+    """
+    Replaces the contents of a file without ever leaving it half-written.
+
+    The lines are written to a temporary file in the same directory, which
+    then replaces the original in a single rename. Symlinks are followed so
+    the link itself is not replaced. The original's permissions, owner and
+    group are copied to the new file, but extended attributes are not.
 
-    # List all files that match the current input
-    return [x for x in glob.glob(text + '*')][state]
+    The rename gives the file a new inode. If the file has other hard links,
+    or its owner cannot be kept (e.g. when not running as root), the file is
+    instead rewritten in place, which is not atomic.
+
+    Parameters:
+    - path (str): The file to overwrite.
+    - lines (List[str]): The lines to write, including their line endings.
+    """
+    path = os.path.realpath(path)
+    original = os.stat(path)
+
+    # a new inode would detach any other hard links to the file
+    if original.st_nlink == 1:
+        try:
+            file = tempfile.NamedTemporaryFile('w', encoding='utf-8', delete=False,
+                                               dir=os.path.dirname(path),
+                                               prefix='.remind-', suffix='.tmp')
+        except PermissionError:
+            # the folder is not writable; write in place below
+            file = None
+
+        if file is not None:
+            # never leave the temporary file behind in the (possibly synced) folder
+            try:
+                with file:
+                    file.writelines(lines)
+                shutil.copymode(path, file.name)
+                os.chown(file.name, original.st_uid, original.st_gid)
+                os.replace(file.name, path)
+                return
+            except PermissionError:
+                # the owner or group cannot be kept; write in place below
+                os.remove(file.name)
+            except BaseException:
+                os.remove(file.name)
+                raise
+
+    with open(path, 'w', encoding='utf-8') as file:
+        file.writelines(lines)
 
 class ReminderManager:
     """
@@ -55,11 +134,11 @@ class ReminderManager:
         # file path for reminders
         self.remind_path_file: str | None = self.cabinet.get('remindmail', 'path', 'file')
 
-        # for sending emails
-        self.mail: Mail = Mail()
+        # for sending emails; created on first use, as Mail reads its own config
+        self._mail: Mail | None = None
 
-        # colors 🎨
-        self.console = Console()
+        # colors 🎨; created on first use, as importing rich is slow
+        self._console: Optional["Console"] = None
 
         # tab completion
         readline.set_completer_delims(' \t\n;')
@@ -68,6 +147,39 @@ class ReminderManager:
 
         self.parsed_reminders: List[reminder.Reminder] = []
 
+        # mtime of remind.md when parsed_reminders was built; None forces a re-parse
+        self.parsed_mtime: int | None = None
+
+    @property
+    def mail(self) -> Mail:
+        """
+        The Mail instance used to send reminders, created on first use
+        so that commands which send nothing (e.g. `--ls`) skip its setup.
+        """
+        if self._mail is None:
+            self._mail = Mail()
+        return self._mail
+
+    @property
+    def mail_if_created(self) -> Mail | None:
+        """
+        The Mail instance if one has been created, without creating it;
+        for Reminders, which create their own Mail only if they send.
+        """
+        return self._mail
+
+    @property
+    def console(self) -> "Console":
+        """
+        The rich Console used for colored output, created on first use
+        so that commands which print nothing (e.g. `--generate`) skip importing rich.
+        """
+        if self._console is None:
+            # pylint: disable=import-outside-toplevel
+            from rich.console import Console
+            self._console = Console()
+        return self._console
+
     @error_handler.ErrorHandler.exception_handler
     def parse_reminders_file(self, filename: str | None = None,
                              is_delete: bool = False,
@@ -102,6 +214,7 @@ class ReminderManager:
         current_notes: List[str] = []
         new_lines: List[str] = []
         delete_current_reminder: bool = False
+        is_modified: bool = False
 
         # handle filename
         filename = filename or self.remind_path_file
@@ -111,7 +224,12 @@ class ReminderManager:
 
         self.cabinet.log(f"Parsing reminders in {filename}", is_quiet=True)
 
+        # evaluated once rather than once per reminder
+        today: date = date.today()
+
         with open(filename, 'r', encoding='utf-8') as file:
+            mtime: int = os.fstat(file.fileno()).st_mtime_ns
+
             for index, line in enumerate(file):
                 stripped_line = line.strip()
 
@@ -125,27 +243,13 @@ class ReminderManager:
                     else:
                         delete_current_reminder = False
 
-                    pattern_any_reminder = r"\[(.*?)\](c?d?)\s*(.*)"
-                    pattern_date_key = r"(?:\d{4}-)?\d{2}-\d{2}"
-                    pattern_dow_key = (
-                        r"^(sun(day)?|"
-                        r"mon(day)?|"
-                        r"tue(sday)?|"
-                        r"wed(nesday)?|"
-                        r"thu(rsday)?|"
-                        r"fri(day)?|"
-                        r"sat(urday)?)$"
-                    )
-
-                    match = re.match(pattern_any_reminder, stripped_line)
+                    match = PATTERN_ANY_REMINDER.match(stripped_line)
                     if match:
                         details, reminder_modifiers, title = match.groups()
-                        details = details.lower()
-
-                        details = details.split(",")
+                        details = details.lower().split(",")
 
                         # remove comments from title (anything after #)
-                        title = re.sub(r"\s*#.*", "", title)
+                        title = title.partition("#")[0]
 
                         # get reminder type
                         try:
@@ -153,12 +257,10 @@ class ReminderManager:
                                 ReminderKeyType.from_db_value(details[0])
                         except ValueError:
                             # allow for [{date}] and [{dow}]
-                            if re.match(pattern_date_key, details[0]):
+                            if PATTERN_DATE_KEY.match(details[0]):
                                 reminder_key = ReminderKeyType.DATE
-                            elif re.match(pattern_dow_key, details[0]):
+                            elif details[0] in DOW_KEYS:
                                 reminder_key = ReminderKeyType.DAY_OF_WEEK
-                                reminder_value = details[0]
-
                             else:
                                 self.cabinet.log(
                                     f"'{details[0]}' in '{line}' is not a valid Reminder key.",
@@ -178,9 +280,7 @@ class ReminderManager:
                             reminder_offset = int(details[2]) if len(details) > 2 else 0
                         elif reminder_key == ReminderKeyType.DAY_OF_MONTH:
                             reminder_value = details[1] or "1"
-                        elif reminder_key in [ReminderKeyType.DAY,
-                                               ReminderKeyType.WEEK,
-                                               ReminderKeyType.MONTH]:
+                        elif reminder_key in FREQUENCY_KEYS:
                             reminder_frequency = int(details[1]) if len(details) > 1 else None
                             reminder_offset = int(details[2]) if len(details) > 2 else 0
                         elif reminder_key == ReminderKeyType.LATER:
@@ -197,13 +297,14 @@ class ReminderManager:
                                                   '',
                                                   index,
                                                   self.cabinet,
-                                                  self.mail,
+                                                  self.mail_if_created,
                                                   path_remind_file=self.remind_path_file)
 
-                        r.should_send_today = r.get_should_send_today()
+                        r.should_send_today = r.get_should_send_today(today)
 
                         if is_delete and r.should_send_today and 'd' in reminder_modifiers:
                             delete_current_reminder = True
+                            is_modified = True
                             self.cabinet.log(f"Will Delete: {r}")
                         else:
                             new_lines.append(line)  # Add non-deleted reminders back
@@ -217,16 +318,19 @@ class ReminderManager:
                         new_lines.append(line)
 
         if current_notes:  # Attach notes to the last reminder; hide comments
-            cleaned_notes = re.sub(r"\s*#.*", "", "\n".join(current_notes))
+            cleaned_notes = PATTERN_COMMENT.sub("", "\n".join(current_notes))
             reminders[-1].notes = cleaned_notes
 
         # Rewrite the file without deleted reminders
-        if is_delete:
-            with open(filename, 'w', encoding='utf-8') as file:
-                file.writelines(new_lines)
+        if is_modified:
+            write_lines_atomically(filename, new_lines)
 
         self.parsed_reminders = reminders
 
+        # only cache the default file, and only if it was not just rewritten
+        is_cacheable = filename == self.remind_path_file and not is_modified
+        self.parsed_mtime = mtime if is_cacheable else None
+
         if is_print:
             for r in reminders:
                 self.console.print(r.title, style="bold green")
@@ -237,6 +341,25 @@ class ReminderManager:
 
         return reminders
 
+    def load_reminders(self) -> List[reminder.Reminder]:
+        """
+        Returns the reminders from remind.md, parsing the file only if it
+        has not been parsed yet or has been modified since the last parse.
+
+        Returns:
+            List[Reminder]: A list of Reminder objects parsed from the file.
+        """
+
+        try:
+            mtime: int | None = os.stat(self.remind_path_file or "").st_mtime_ns
+        except OSError:
+            mtime = None
+
+        if self.parsed_mtime is None or mtime != self.parsed_mtime:
+            self.parse_reminders_file()
+
+        return self.parsed_reminders
+
     @error_handler.ErrorHandler.exception_handler
     def generate(self, is_dry_run: bool) -> None:
         """
@@ -250,81 +373,84 @@ class ReminderManager:
         Afterwards, delete the reminders from the file.
         """
 
-        lines_to_delete: List[int] = []
+        self.cabinet.log("Generating Reminders")
 
-        if not self.parsed_reminders:
-            self.parse_reminders_file()
+        reminders_due = [r for r in self.load_reminders() if r.should_send_today]
+
+        # nothing to send or run; skip mail and command setup
+        if not reminders_due:
+            self.cabinet.log("No reminders are scheduled for today")
+
+            # put() rewrites all of Cabinet's data; skip it if the count is already 0
+            if not is_dry_run and self.cabinet.get("remindmail", "sent_today") != 0:
+                self.cabinet.put("remindmail", "sent_today", 0, is_print=True)
+            return
+
+        lines_to_delete: List[int] = []
 
         count_sent = 0
 
-        if self.mail is None:
-            self.mail = Mail()
+        # add path so things like `cabinet` calls work from crontab;
+        # built once and shared by every command reminder
+        path_local_bin = os.path.join(os.path.expanduser("~"), ".local/bin")
+        command_env = {**os.environ, "PATH": f"{path_local_bin}:{os.environ['PATH']}"}
 
-        self.cabinet.log("Generating Reminders")
-        for r in self.parsed_reminders:
-            if r.should_send_today:
-                self.cabinet.log(str(r), is_quiet=True)
+        for r in reminders_due:
+            self.cabinet.log(str(r), is_quiet=True)
 
-                if 'd' in r.modifiers:
-                    # mark the reminder line for deletion
-                    lines_to_delete.append(r.index+1)
+            if 'd' in r.modifiers:
+                # mark the reminder line for deletion
+                lines_to_delete.append(r.index+1)
 
-                    if r.notes:
-                        # add the lines for each note to lines_to_delete
-                        note_line_count = len(r.notes.splitlines())
+                if r.notes:
+                    # add the lines for each note to lines_to_delete
+                    note_line_count = len(r.notes.splitlines())
 
-                        # handle missed reminders
-                        if r.notes.startswith("This was scheduled to send on "):
-                            note_line_count -= 1
+                    # handle missed reminders
+                    if r.notes.startswith("This was scheduled to send on "):
+                        note_line_count -= 1
 
-                        lines_to_delete.extend(
-                            range(r.index + 2, r.index + 2 + note_line_count)
-                        )
+                    lines_to_delete.extend(
+                        range(r.index + 2, r.index + 2 + note_line_count)
+                    )
 
-                    if is_dry_run:
-                        self.cabinet.log(
-                            f"Would delete reminder: {r.title}\nand delete lines {lines_to_delete}",
-                            level="debug"
-                        )
+                if is_dry_run:
+                    self.cabinet.log(
+                        f"Would delete reminder: {r.title}\nand delete lines {lines_to_delete}",
+                        level="debug"
+                    )
 
-                # handle commands
-                if 'c' in r.modifiers:
+            # handle commands
+            if 'c' in r.modifiers:
+                self.cabinet.log(
+                        f"Executing command: {r.title}", level="debug"
+                    )
+                try:
+                    cmd_output = subprocess.check_output(
+                        r.title, shell=True, universal_newlines=True, env=command_env
+                    )
+                    self.cabinet.log(
+                        f"Results: {cmd_output}", level="debug"
+                    )
+                except subprocess.CalledProcessError as error:
                     self.cabinet.log(
-                            f"Executing command: {r.title}", level="debug"
-                        )
-                    try:
-                        # add path so things like `cabinet` calls work from crontab
-                        home_dir = os.path.expanduser("~")
-                        path_local_bin = os.path.join(home_dir, ".local/bin")
-                        os.environ[
-                            "PATH"
-                        ] = f"{path_local_bin}:{os.environ['PATH']}"
-
-                        cmd_output = subprocess.check_output(
-                            r.title, shell=True, universal_newlines=True
-                        )
-                        self.cabinet.log(
-                            f"Results: {cmd_output}", level="debug"
-                        )
-                    except subprocess.CalledProcessError as error:
-                        self.cabinet.log(
-                            f"Command execution failed with exit code: {error.returncode}",
-                            level="error",
-                        )
-                        self.cabinet.log(
-                            f"Error output: {error.output}", level="error"
-                        )
-                    continue
-
-                r.mail = self.mail
-
-                if not is_dry_run:
-                    r.send_email()
-                    count_sent += 1
-                else:
+                        f"Command execution failed with exit code: {error.returncode}",
+                        level="error",
+                    )
                     self.cabinet.log(
-                        f"Would send email: {r.title} (notes: {r.notes or "None"})\n",
-                        level="debug")
+                        f"Error output: {error.output}", level="error"
+                    )
+                continue
+
+            r.mail = self.mail
+
+            if not is_dry_run:
+                r.send_email()
+                count_sent += 1
+            else:
+                self.cabinet.log(
+                    f"Would send email: {r.title} (notes: {r.notes or "None"})\n",
+                    level="debug")
 
         # Remove lines corresponding to sent reminders from the reminders file.
         self.delete_reminders(lines_to_delete, is_dry_run=is_dry_run)
@@ -337,10 +463,7 @@ class ReminderManager:
         Shows all reminders tagged as 'later'
         """
 
-        if not self.parsed_reminders:
-            self.parse_reminders_file()
-
-        for r in self.parsed_reminders:
+        for r in self.load_reminders():
             if r.key == ReminderKeyType.LATER:
                 self.console.print(r.title, style="bold green")
                 print(r.notes)
@@ -357,16 +480,17 @@ class ReminderManager:
         to highlight their importance or category.
         """
 
-        current_time = datetime.now().time()
-        start_day_offset = 0 if current_time.hour < 4 else 1
+        # read the clock once so the hour and the date always agree
+        now = datetime.now()
+        today = now.date()
+        start_day_offset = 0 if now.hour < 4 else 1
 
         # Prepare the next 7 days
-        dates = [date.today() + timedelta(days=i) for i in range(
+        dates = [today + timedelta(days=i) for i in range(
             start_day_offset, limit)]
 
         # Parse reminders file if necessary
-        if not self.parsed_reminders:
-            self.parse_reminders_file()
+        reminders = self.load_reminders()
 
         # Iterate through each upcoming day
         for day in dates:
@@ -377,7 +501,7 @@ class ReminderManager:
             reminder_shown = False
 
             # Display each reminder scheduled for this day
-            for r in self.parsed_reminders:
+            for r in reminders:
                 if r.get_should_send_today(day):
                     reminder_style = f"bold {'purple' if 'c' in r.modifiers else 'green'}"
                     self.console.print(r.title, style=reminder_style, highlight=False)
@@ -437,20 +561,20 @@ class ReminderManager:
             return True
 
         path = self.remind_path_file or self.cabinet.get('remindmail', 'path', 'file') or ""
-        self.remind_path_file = path.replace("remind.md", "")
+        if os.path.basename(path) == "remind.md":
+            path = os.path.dirname(path)
 
-        # Ensure we have a directory and it ends correctly
-        if not self.remind_path_file:
+        # Ensure we have a directory, normalizing any trailing separator
+        if not path:
             raise FileNotFoundError(
                 "Cannot find remind.md. Set with `cabinet -p remindmail path file <path>`")
 
-        if self.remind_path_file.endswith('/'):
-            self.remind_path_file = self.remind_path_file.rstrip('/')
+        self.remind_path_file = os.path.normpath(path)
 
         # Update path in Cabinet if it points to a directory
         if os.path.isdir(self.remind_path_file):
             old_value = self.remind_path_file
-            new_value = f"{self.remind_path_file}/remind.md"
+            new_value = os.path.join(self.remind_path_file, "remind.md")
             self.remind_path_file = new_value
             self.cabinet.log(
                 "Updating remindmail -> path -> file in "
@@ -468,16 +592,13 @@ class ReminderManager:
         tagged as `later`
         """
 
-        if not self.parsed_reminders:
-            self.parse_reminders_file()
-
         today = date.today().strftime('%Y-%m-%d')
 
         # get a bulleted list of all 'later' reminders
         self.cabinet.log("Getting 'later' reminders")
 
         reminders = ""
-        for r in self.parsed_reminders:
+        for r in self.load_reminders():
             if r.key == ReminderKeyType.LATER:
                 reminders += f"• {r.title}<br>"
                 if r.notes:
@@ -504,6 +625,10 @@ class ReminderManager:
         - is_dry_run (bool): If True, the method will not delete the lines from the file.
         """
 
+        # nothing to delete; avoid rewriting the file
+        if not lines_to_delete:
+            return
+
         # Convert 1-based indices to 0-based indices for internal processing
         zero_based_indices = {line - 1 for line in lines_to_delete}
 
@@ -512,10 +637,21 @@ class ReminderManager:
                 f"Would delete lines: {lines_to_delete}", level="debug")
             return
 
-        path: str = self.remind_path_file or self.cabinet.get('remindmail', 'path', 'file') or ""
+        # cache the lookup so subsequent reads skip Cabinet
+        if not self.remind_path_file:
+            self.remind_path_file = self.cabinet.get('remindmail', 'path', 'file')
+        path: str = self.remind_path_file or ""
+        # stream the file, holding only the lines that are kept
         with open(path, "r", encoding="utf-8") as file:
-            lines = file.readlines()
-        with open(path, "w", encoding="utf-8") as file:
-            for index, line in enumerate(lines):
+            line_count = 0
+            kept_lines: List[str] = []
+            for index, line in enumerate(file):
+                line_count += 1
                 if index not in zero_based_indices:
-                    file.write(line)
+                    kept_lines.append(line)
+
+        # every index was past the end of the file; nothing changed
+        if len(kept_lines) == line_count:
+            return
+
+        write_lines_atomically(path, kept_lines)
@@ -3,7 +3,8 @@ A work-in-progress set of tests for remindmail
 """
 # pylint: disable=line-too-long
 
-import os
+import shlex
+import subprocess
 
 tests: dict = {
     "test1": "remind --title test --when tomorrow",
@@ -20,5 +21,5 @@ tests: dict = {
 
 for test, command in tests.items():
     print(f"Running test {test}")
-    os.system(command)
+    subprocess.run(shlex.split(command), check=False)
     print(f"Test {test} complete")